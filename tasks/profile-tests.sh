@@ -0,0 +1,18 @@
+#!/bin/bash
+# Profile the VM lifecycle test suite
+# Lists the slowest tests and, when Scalene is installed, writes a
+# line-level CPU profile of the VM creation tests to scalene-tests.html
+
+set -euo pipefail
+
+echo "=== Slowest VM lifecycle tests ==="
+pytest tests/vm_lifecycle/ -q -o addopts="" --durations=20 --durations-min=0 || true
+
+if command -v scalene >/dev/null 2>&1; then
+    echo "=== Scalene CPU profile: test_create_vm.py ==="
+    scalene --cpu --html --outfile=scalene-tests.html \
+        -m pytest tests/vm_lifecycle/test_create_vm.py -q -o addopts=""
+    echo "Profile written to scalene-tests.html"
+else
+    echo "⚠️  Scalene not installed, skipping line-level profile (pip install scalene)"
+fi
@@ -0,0 +1,59 @@
+#!/bin/bash
+# Run only the tests affected by the current changes
+# Usage: tasks/select-tests.sh [BASE_REF] [-- PYTEST_ARGS...]
+#
+# Changed files are taken from `git diff --name-only BASE_REF` (default HEAD)
+# plus untracked files, and mapped to test paths below. Changes that can
+# affect everything (fixtures, conftest, config, unmapped source) run the
+# full suite; documentation-only changes run nothing.
+
+set -euo pipefail
+
+BASE_REF="HEAD"
+if [ $# -gt 0 ] && [ "$1" != "--" ]; then
+    BASE_REF="$1"
+    shift
+fi
+[ "${1:-}" = "--" ] && shift
+
+CHANGED=$( (git diff --name-only "$BASE_REF"; git ls-files --others --exclude-standard) | sort -u)
+
+declare -A SELECTED=()
+FULL_SUITE=0
+
+while IFS= read -r path; do
+    [ -z "$path" ] && continue
+    case "$path" in
+        # test_server.py drives the registered tools (VMTools.get_vms,
+        # execute_vm_command and through it the console manager), so it
+        # runs alongside the dedicated tests for any tool module
+        src/proxmox_mcp/tools/vm.py)
+            SELECTED["tests/vm_lifecycle"]=1
+            SELECTED["tests/test_server.py"]=1 ;;
+        src/proxmox_mcp/tools/console/*)
+            SELECTED["tests/test_vm_console.py"]=1
+            SELECTED["tests/test_server.py"]=1 ;;
+        src/proxmox_mcp/tools/container.py)
+            SELECTED["tests/container_lifecycle"]=1
+            SELECTED["tests/test_server.py"]=1 ;;
+        tests/*/test_*.py|tests/test_*.py)
+            [ -f "$path" ] && SELECTED["$path"]=1 ;;
+        *.md|Graphics/*|tasks/*)
+            ;;
+        *)
+            FULL_SUITE=1 ;;
+    esac
+done <<< "$CHANGED"
+
+if [ "$FULL_SUITE" -eq 1 ]; then
+    echo "🔍 Shared code or configuration changed, running full suite"
+    exec pytest "$@"
+fi
+
+if [ ${#SELECTED[@]} -eq 0 ]; then
+    echo "✅ No changes affecting tests since $BASE_REF"
+    exit 0
+fi
+
+echo "🔍 Running tests for: ${!SELECTED[*]}"
+exec pytest "${!SELECTED[@]}" "$@"
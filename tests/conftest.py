@@ -4,13 +4,39 @@ Shared pytest fixtures for ProxmoxMCP tests.
 Provides common fixtures following SOLID principles that can be used
 across different test modules.
 """
+import asyncio
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+# Imported up front so the one-off cost of loading the tools (and mcp)
+# is paid during collection instead of by whichever test runs first
+import proxmox_mcp.tools.vm  # noqa: F401
 from tests.fixtures.mock_helpers import ProxmoxAPIMockBuilder, VMToolsMockHelper
 from tests.fixtures.vm_data_factory import VMTestDataFactory
 
 
+_real_sleep = asyncio.sleep
+
+
+async def _skip_sleep(delay, result=None):
+    """Stand-in for asyncio.sleep that yields to the event loop without waiting."""
+    return await _real_sleep(0, result)
+
+
+@pytest.fixture
+def no_sleep():
+    """Remove fixed waits (e.g. the console manager's exec delay) from a test.
+    
+    Every sleep still yields to the event loop once, so code under test
+    awaits at the same points, in the same order; only the wall-clock
+    time of the sleep is skipped. Modules that reach the console manager
+    opt in with ``pytestmark = pytest.mark.usefixtures("no_sleep")``.
+    """
+    with patch("asyncio.sleep", new=_skip_sleep):
+        yield
+
+
 @pytest.fixture
 def vm_data_factory():
     """Provide VM test data factory instance.
@@ -4,13 +4,46 @@ Base test classes following SOLID principles.
 Provides extensible base classes that can be inherited and extended
 without modification (Open/Closed Principle).
 """
+import functools
+import re
+
 import pytest
+from types import MappingProxyType
 from unittest.mock import Mock
-from typing import Dict, Any
-
-from .mock_helpers import ProxmoxAPIMockBuilder, VMToolsMockHelper, ContainerToolsMockHelper, AssertionHelper
+from typing import Dict, Any, ClassVar, Mapping, Optional
+
+from .mock_helpers import (
+    ProxmoxAPIMockBuilder,
+    MockPrototypeCache,
+    VMToolsMockHelper,
+    ContainerToolsMockHelper,
+    AssertionHelper,
+)
+from .proxmox_stub import ProxmoxAPIStub
 from .vm_data_factory import VMTestDataFactory, ContainerTestDataFactory
 
+# Read-only so a single instance can be shared by every test
+DEFAULT_TEST_PARAMS: Mapping[str, str] = MappingProxyType({
+    "node": "node1",
+    "vmid": "100"
+})
+
+
+# VM status each operation requires before it calls the Proxmox API
+OPERATION_READY_STATUS: Mapping[str, str] = MappingProxyType({
+    "start": "stopped",
+    "stop": "running",
+    "shutdown": "running",
+    "restart": "running",
+    "delete": "stopped",
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_pattern(expected_message: str) -> "re.Pattern[str]":
+    """Compile an expected error message once for all tests using it."""
+    return re.compile(expected_message)
+
 
 class BaseVMOperationTest:
     """Base class for VM operation tests.
@@ -19,15 +52,28 @@ class BaseVMOperationTest:
     without modifying this base class. Provides common setup and utilities.
     """
 
+    # Stateless, so one instance is shared by every test
+    assertion_helper: ClassVar[AssertionHelper] = AssertionHelper()
+
     def setup_method(self):
         """Set up test method with fresh mocks.
         
         Each test gets a clean mock environment (test isolation).
         """
-        self.mock_builder = ProxmoxAPIMockBuilder()
-        self.assertion_helper = AssertionHelper()
+        self._mock_builder = None
         self.data_factory = VMTestDataFactory()
 
+    @property
+    def mock_builder(self) -> ProxmoxAPIMockBuilder:
+        """Fresh mock builder for the current test.
+        
+        Built on first access so tests using cached setup helpers skip
+        the cost of an unused Mock tree.
+        """
+        if self._mock_builder is None:
+            self._mock_builder = ProxmoxAPIMockBuilder()
+        return self._mock_builder
+
     def create_vm_tools_with_mock(self, mock_proxmox: Mock):
         """Create VMTools instance with mock dependency injection.
         
@@ -39,16 +85,24 @@ class BaseVMOperationTest:
         """
         return VMToolsMockHelper.create_vm_tools_with_mock(mock_proxmox)
 
-    def get_default_test_params(self) -> Dict[str, str]:
+    def get_default_test_params(self) -> Mapping[str, str]:
         """Get default test parameters for VM operations.
         
         Returns:
-            Dict with default node and vmid
+            Read-only mapping with default node and vmid
         """
-        return {
-            "node": "node1", 
-            "vmid": "100"
-        }
+        return DEFAULT_TEST_PARAMS
+
+    def parse_response(self, response: list) -> Dict[str, Any]:
+        """Decode the JSON body of an operation response.
+        
+        Args:
+            response: Operation response
+            
+        Returns:
+            Decoded response data (shared, do not mutate)
+        """
+        return AssertionHelper.parse_response(response)
 
 
 class BaseVMStartStopTest(BaseVMOperationTest):
@@ -58,35 +112,45 @@ class BaseVMStartStopTest(BaseVMOperationTest):
     Demonstrates inheritance following Liskov Substitution Principle.
     """
 
-    def setup_vm_for_start_test(self, **overrides) -> Mock:
+    def setup_vm_for_start_test(self, task_id: Optional[str] = None, **overrides) -> Mock:
         """Set up mock for VM start test scenario.
         
         Args:
+            task_id: Custom start task ID (optional)
             **overrides: Override default VM configuration
             
         Returns:
-            Configured mock ProxmoxAPI
+            Configured mock ProxmoxAPI, shared with other start tests
+            using the same configuration
         """
         status = overrides.pop("status", "stopped")
-        return (self.mock_builder
-                .with_vm_status(status=status, **overrides)
-                .with_start_operation()
-                .build())
-
-    def setup_vm_for_stop_test(self, **overrides) -> Mock:
+        return MockPrototypeCache.get(
+            ("start", status, task_id, tuple(sorted(overrides.items()))),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_status(status=status, **overrides)
+                     .with_start_operation(task_id)
+                     .build()),
+        )
+
+    def setup_vm_for_stop_test(self, task_id: Optional[str] = None, **overrides) -> Mock:
         """Set up mock for VM stop test scenario.
         
         Args:
+            task_id: Custom stop task ID (optional)
             **overrides: Override default VM configuration
             
         Returns:
-            Configured mock ProxmoxAPI
+            Configured mock ProxmoxAPI, shared with other stop tests
+            using the same configuration
         """
         status = overrides.pop("status", "running")
-        return (self.mock_builder
-                .with_vm_status(status=status, **overrides)
-                .with_stop_operation()
-                .build())
+        return MockPrototypeCache.get(
+            ("stop", status, task_id, tuple(sorted(overrides.items()))),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_status(status=status, **overrides)
+                     .with_stop_operation(task_id)
+                     .build()),
+        )
 
     def assert_start_operation_success(self, response: list, vmid: str = "100"):
         """Assert start operation was successful.
@@ -115,34 +179,85 @@ class BaseVMLifecycleTest(BaseVMOperationTest):
     Extends base class with lifecycle-specific functionality.
     """
 
-    def setup_vm_for_create_test(self, **overrides) -> Mock:
+    def setup_vm_for_create_test(self) -> Mock:
         """Set up mock for VM creation test scenario.
         
-        Args:
-            **overrides: Override default configuration
-            
         Returns:
-            Configured mock ProxmoxAPI
+            Configured mock ProxmoxAPI, shared with other creation tests
         """
-        return (self.mock_builder
-                .with_vm_not_found_error()  # VM doesn't exist, good for creation
-                .with_create_operation()
-                .build())
+        return MockPrototypeCache.get(
+            "create",
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_not_found_error()  # VM doesn't exist, good for creation
+                     .with_create_operation()
+                     .build()),
+        )
 
-    def setup_vm_for_delete_test(self, **overrides) -> Mock:
+    def setup_vm_for_create_existing_test(self) -> Mock:
+        """Set up mock for creating a VM whose VMID is already taken.
+        
+        Returns:
+            Configured mock ProxmoxAPI where the status check finds a
+            stopped VM and the create call still succeeds
+        """
+        return MockPrototypeCache.get(
+            "create_existing",
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_status("stopped")
+                     .with_create_operation("UPID:task123")
+                     .build()),
+        )
+
+    def setup_vm_for_delete_test(self, task_id: Optional[str] = None, **overrides) -> Mock:
         """Set up mock for VM deletion test scenario.
         
         Args:
+            task_id: Custom deletion task ID (optional)
             **overrides: Override default configuration
             
         Returns:
-            Configured mock ProxmoxAPI
+            Configured mock ProxmoxAPI, shared with other deletion tests
+            using the same configuration
         """
         status = overrides.pop("status", "stopped")
-        return (self.mock_builder
-                .with_vm_status(status=status, **overrides)
-                .with_delete_operation()
-                .build())
+        return MockPrototypeCache.get(
+            ("delete", status, task_id, tuple(sorted(overrides.items()))),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_status(status=status, **overrides)
+                     .with_delete_operation(task_id)
+                     .build()),
+        )
+
+    def setup_vm_for_delete_failure_test(self, error_message: str) -> Mock:
+        """Set up mock for a stopped VM whose deletion fails.
+        
+        Args:
+            error_message: Error message raised by the delete endpoint
+            
+        Returns:
+            Configured mock ProxmoxAPI, shared with other tests using the
+            same error message
+        """
+        return MockPrototypeCache.get(
+            ("delete_error", error_message),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_status("stopped")
+                     .with_operation_error("delete", error_message)
+                     .build()),
+        )
+
+    def get_create_call_kwargs(self, mock_proxmox: Mock) -> Dict[str, Any]:
+        """Get keyword arguments of the single VM creation API call.
+        
+        Args:
+            mock_proxmox: Mock ProxmoxAPI instance
+            
+        Returns:
+            Dict of keyword arguments passed to qemu.post
+        """
+        create_post = mock_proxmox.nodes.return_value.qemu.post
+        create_post.assert_called_once()
+        return create_post.call_args.kwargs
 
     def assert_create_operation_success(self, response: list, vmid: str = "100", name: str = "test-vm"):
         """Assert create operation was successful.
@@ -172,35 +287,45 @@ class BaseVMStateChangeTest(BaseVMOperationTest):
     Extends base class with state change specific functionality.
     """
 
-    def setup_vm_for_shutdown_test(self, **overrides) -> Mock:
+    def setup_vm_for_shutdown_test(self, task_id: Optional[str] = None, **overrides) -> Mock:
         """Set up mock for VM shutdown test scenario.
         
         Args:
+            task_id: Custom shutdown task ID (optional)
             **overrides: Override default configuration
             
         Returns:
-            Configured mock ProxmoxAPI
+            Configured mock ProxmoxAPI, shared with other shutdown tests
+            using the same configuration
         """
         status = overrides.pop("status", "running")
-        return (self.mock_builder
-                .with_vm_status(status=status, **overrides)
-                .with_shutdown_operation()
-                .build())
-
-    def setup_vm_for_restart_test(self, **overrides) -> Mock:
+        return MockPrototypeCache.get(
+            ("shutdown", status, task_id, tuple(sorted(overrides.items()))),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_status(status=status, **overrides)
+                     .with_shutdown_operation(task_id)
+                     .build()),
+        )
+
+    def setup_vm_for_restart_test(self, task_id: Optional[str] = None, **overrides) -> Mock:
         """Set up mock for VM restart test scenario.
         
         Args:
+            task_id: Custom reboot task ID (optional)
             **overrides: Override default configuration
             
         Returns:
-            Configured mock ProxmoxAPI
+            Configured mock ProxmoxAPI, shared with other restart tests
+            using the same configuration
         """
         status = overrides.pop("status", "running")
-        return (self.mock_builder
-                .with_vm_status(status=status, **overrides)
-                .with_restart_operation()
-                .build())
+        return MockPrototypeCache.get(
+            ("restart", status, task_id, tuple(sorted(overrides.items()))),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_status(status=status, **overrides)
+                     .with_restart_operation(task_id)
+                     .build()),
+        )
 
     def assert_shutdown_operation_success(self, response: list, vmid: str = "100"):
         """Assert shutdown operation was successful.
@@ -234,45 +359,85 @@ class BaseVMErrorTest(BaseVMOperationTest):
         """Set up mock for 'VM already running' error scenario.
         
         Returns:
-            Mock configured to return running status
+            Mock configured to return running status, shared with other
+            tests
         """
-        return (self.mock_builder
-                .with_vm_status("running")
-                .build())
+        return MockPrototypeCache.get(
+            ("status", "running"),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_status("running")
+                     .build()),
+        )
 
     def setup_vm_already_stopped_error(self) -> Mock:
         """Set up mock for 'VM already stopped' error scenario.
         
         Returns:
-            Mock configured to return stopped status
+            Mock configured to return stopped status, shared with other
+            tests
         """
-        return (self.mock_builder
-                .with_vm_status("stopped")
-                .build())
+        return MockPrototypeCache.get(
+            ("status", "stopped"),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_status("stopped")
+                     .build()),
+        )
 
     def setup_vm_not_found_error(self) -> Mock:
         """Set up mock for 'VM not found' error scenario.
         
         Returns:
-            Mock configured to raise not found error
+            Mock configured to raise not found error, shared with other
+            tests
         """
-        return (self.mock_builder
-                .with_vm_not_found_error()
-                .build())
+        return MockPrototypeCache.get(
+            ("not_found",),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_not_found_error()
+                     .build()),
+        )
+
+    def setup_status_check_error(self, error_message: str) -> Mock:
+        """Set up mock whose VM status check fails with an API error.
+        
+        Args:
+            error_message: Error message raised by the status check
+            
+        Returns:
+            Mock configured to raise on status check, shared with other
+            tests using the same message
+        """
+        return MockPrototypeCache.get(
+            ("status_error", error_message),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_status_check_error(error_message)
+                     .build()),
+        )
 
     def setup_operation_failure_error(self, operation: str, error_message: str = "Operation failed") -> Mock:
         """Set up mock for operation failure scenario.
         
+        The VM status check reports a state the operation accepts (or no
+        VM, for create), so the failure comes from the operation call.
+        
         Args:
             operation: Operation that should fail
             error_message: Error message to use
             
         Returns:
-            Mock configured to raise operation error
+            Mock configured to raise operation error, shared with other
+            tests using the same operation and message
         """
-        return (self.mock_builder
-                .with_operation_error(operation, error_message)
-                .build())
+        def build() -> Mock:
+            builder = ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+            status = OPERATION_READY_STATUS.get(operation)
+            if status is None:
+                builder.with_vm_not_found_error()
+            else:
+                builder.with_vm_status(status)
+            return builder.with_operation_error(operation, error_message).build()
+
+        return MockPrototypeCache.get(("operation_error", operation, error_message), build)
 
     def assert_value_error_raised(self, expected_message: str):
         """Context manager for asserting ValueError with specific message.
@@ -283,7 +448,7 @@ class BaseVMErrorTest(BaseVMOperationTest):
         Returns:
             pytest.raises context manager
         """
-        return pytest.raises(ValueError, match=expected_message)
+        return pytest.raises(ValueError, match=_compile_pattern(expected_message))
 
     def assert_runtime_error_raised(self, expected_message: str):
         """Context manager for asserting RuntimeError with specific message.
@@ -294,7 +459,59 @@ class BaseVMErrorTest(BaseVMOperationTest):
         Returns:
             pytest.raises context manager
         """
-        return pytest.raises(RuntimeError, match=expected_message)
+        return pytest.raises(RuntimeError, match=_compile_pattern(expected_message))
+
+
+class BaseVMIntegrationTest(BaseVMLifecycleTest, BaseVMErrorTest):
+    """Base class for VM workflows spanning several operations.
+    
+    Combines the lifecycle and error test bases so a workflow can mix
+    successful and failing operations on the same VM.
+    """
+
+    # Status reported before create, start, stop and delete (None = no VM)
+    STANDARD_LIFECYCLE_STATUSES = (None, "stopped", "running", "stopped")
+
+    def setup_standard_lifecycle_mock(
+        self, vm_count: int = 1, task_ids: Optional[Mapping[str, str]] = None
+    ) -> Mock:
+        """Set up mock for a create → start → stop → delete lifecycle.
+        
+        Every status check reports the state the next operation expects.
+        With several VMs each step runs for every VM before the next step.
+        
+        Args:
+            vm_count: Number of VMs driven through the lifecycle together
+            task_ids: Task ID per operation name (optional, defaults are
+                used for missing operations)
+            
+        Returns:
+            Configured mock ProxmoxAPI, shared with other lifecycle tests
+            using the same VM count and task IDs
+        """
+        task_ids = task_ids or {}
+        statuses = tuple(
+            status for status in self.STANDARD_LIFECYCLE_STATUSES for _ in range(vm_count)
+        )
+        return MockPrototypeCache.get(
+            ("lifecycle", vm_count, tuple(sorted(task_ids.items()))),
+            lambda: (ProxmoxAPIMockBuilder(ProxmoxAPIStub())
+                     .with_vm_status_sequence(*statuses)
+                     .with_create_operation(task_ids.get("create"))
+                     .with_start_operation(task_ids.get("start"))
+                     .with_stop_operation(task_ids.get("stop"))
+                     .with_delete_operation(task_ids.get("delete"))
+                     .build()),
+        )
+
+    def assert_operation_success(self, response: list, expected_message: str):
+        """Assert an operation in the workflow was successful.
+        
+        Args:
+            response: Operation response
+            expected_message: Expected success message substring
+        """
+        self.assertion_helper.assert_success_response(response, expected_message)
 
 
 class BaseContainerOperationTest:
@@ -304,13 +521,15 @@ class BaseContainerOperationTest:
     without modifying this base class. Provides common setup and utilities.
     """
 
+    # Stateless, so one instance is shared by every test
+    assertion_helper: ClassVar[AssertionHelper] = AssertionHelper()
+
     def setup_method(self):
         """Set up test method with fresh mocks.
         
         Each test gets a clean mock environment (test isolation).
         """
         self.mock_builder = ProxmoxAPIMockBuilder()
-        self.assertion_helper = AssertionHelper()
         self.data_factory = ContainerTestDataFactory()
 
     def create_container_tools_with_mock(self, mock_proxmox: Mock):
@@ -4,11 +4,33 @@ Mock helper utilities following SOLID principles.
 Provides focused mock configurations that implement only the interfaces
 needed for specific tests (Interface Segregation Principle).
 """
-from unittest.mock import Mock, MagicMock
-from typing import Dict, Any, Optional, Union
+import functools
+import json
+import operator
+from unittest.mock import Mock
+from typing import Dict, Any, Callable, Hashable, Optional, Union
+
+from proxmoxer import ResourceException
+
 from .vm_data_factory import VMTestDataFactory, ProxmoxAPIResponseFactory, ContainerTestDataFactory
 
 
+# Endpoint of each VM operation, relative to nodes(node).qemu(vmid)
+_VM_OPERATION_ENDPOINTS = {
+    "start": operator.attrgetter("status.start.post"),
+    "stop": operator.attrgetter("status.stop.post"),
+    "shutdown": operator.attrgetter("status.shutdown.post"),
+    "restart": operator.attrgetter("status.reboot.post"),
+    "delete": operator.attrgetter("delete"),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_response_text(text: str) -> Dict[str, Any]:
+    """Decode a JSON response body once per distinct text."""
+    return json.loads(text)
+
+
 class ProxmoxAPIMockBuilder:
     """Builder for creating focused ProxmoxAPI mocks.
     
@@ -16,10 +38,18 @@ class ProxmoxAPIMockBuilder:
     minimal mocks that only implement methods needed for specific tests.
     """
 
-    def __init__(self):
-        """Initialize the mock builder."""
-        self.mock = Mock()
-        self._configure_base_structure()
+    def __init__(self, api: Optional[Any] = None):
+        """Initialize the mock builder.
+        
+        Args:
+            api: Test double to configure, e.g. a ProxmoxAPIStub
+                (optional, a fresh Mock tree is created if None)
+        """
+        if api is None:
+            self.mock = Mock()
+            self._configure_base_structure()
+        else:
+            self.mock = api
 
     def _configure_base_structure(self) -> None:
         """Configure the basic ProxmoxAPI mock structure."""
@@ -53,6 +83,27 @@ class ProxmoxAPIMockBuilder:
         self.mock.nodes.return_value.qemu.return_value.status.current.get.return_value = status_response
         return self
 
+    def with_vm_status_sequence(self, *statuses: Optional[str], vmid: str = "100") -> "ProxmoxAPIMockBuilder":
+        """Configure consecutive VM status checks to return different statuses.
+        
+        Each status check consumes the next entry, which lets a lifecycle
+        test walk one VM through several operations.
+        
+        Args:
+            *statuses: VM status per check, or None for a "VM not found" error
+            vmid: VM ID
+            
+        Returns:
+            Self for method chaining
+        """
+        responses = [
+            Exception("VM not found") if status is None
+            else VMTestDataFactory.create_vm_status_response(status=status, vmid=vmid)
+            for status in statuses
+        ]
+        self.mock.nodes.return_value.qemu.return_value.status.current.get.side_effect = responses
+        return self
+
     def with_start_operation(self, task_id: Optional[str] = None) -> "ProxmoxAPIMockBuilder":
         """Configure mock for VM start operation.
         
@@ -109,14 +160,17 @@ class ProxmoxAPIMockBuilder:
         self.mock.nodes.return_value.qemu.return_value.status.reboot.post.return_value = task_id
         return self
 
-    def with_create_operation(self) -> "ProxmoxAPIMockBuilder":
+    def with_create_operation(self, task_id: Optional[str] = None) -> "ProxmoxAPIMockBuilder":
         """Configure mock for VM creation operation.
         
+        Args:
+            task_id: Task ID returned by the create call (optional,
+                the call returns None if omitted)
+            
         Returns:
             Self for method chaining
         """
-        # Create operation doesn't return a task ID, just succeeds
-        self.mock.nodes.return_value.qemu.post.return_value = None
+        self.mock.nodes.return_value.qemu.post.return_value = task_id
         return self
 
     def with_delete_operation(self, task_id: Optional[str] = None) -> "ProxmoxAPIMockBuilder":
@@ -143,6 +197,19 @@ class ProxmoxAPIMockBuilder:
         self.mock.nodes.return_value.qemu.return_value.status.current.get.side_effect = error
         return self
 
+    def with_status_check_error(self, error_message: str) -> "ProxmoxAPIMockBuilder":
+        """Configure the VM status check to raise a Proxmox API error.
+        
+        Args:
+            error_message: Error message carried by the ResourceException
+            
+        Returns:
+            Self for method chaining
+        """
+        error = ResourceException(500, "Internal Server Error", error_message)
+        self.mock.nodes.return_value.qemu.return_value.status.current.get.side_effect = error
+        return self
+
     def with_operation_error(self, operation: str, error_message: str = "Operation failed") -> "ProxmoxAPIMockBuilder":
         """Configure mock to raise error for specific operation.
         
@@ -262,6 +329,40 @@ class ProxmoxAPIMockBuilder:
         return self.mock
 
 
+class MockPrototypeCache:
+    """Process-wide cache of built ProxmoxAPI mocks keyed by scenario.
+
+    Building a configured mock tree costs roughly ten times more than
+    resetting one, so each scenario is built once per process (per xdist
+    worker) and its call history is cleared before every reuse. A shallow
+    ``copy.copy`` is not an option here: the copy would share child mocks
+    and therefore call records with the prototype.
+
+    Configured ``return_value``/``side_effect`` values survive the reset,
+    so tests must not reconfigure a mock obtained from this cache.
+    """
+
+    _prototypes: Dict[Hashable, Mock] = {}
+
+    @classmethod
+    def get(cls, key: Hashable, factory: Callable[[], Mock]) -> Mock:
+        """Return the prototype for ``key`` with a clean call history.
+
+        Args:
+            key: Scenario identifier
+            factory: Builds the mock the first time ``key`` is requested
+
+        Returns:
+            Configured mock ProxmoxAPI
+        """
+        mock = cls._prototypes.get(key)
+        if mock is None:
+            mock = cls._prototypes[key] = factory()
+        else:
+            mock.reset_mock()
+        return mock
+
+
 class VMToolsMockHelper:
     """Helper for creating VMTools instances with mocked dependencies.
     
@@ -272,6 +373,10 @@ class VMToolsMockHelper:
     def create_vm_tools_with_mock(mock_proxmox: Mock):
         """Create VMTools instance with injected mock.
         
+        VMTools.__init__ only stores references (a few microseconds), so a
+        fresh instance per test is kept rather than rebinding a shared one;
+        rebinding would also have to reach into the console manager.
+        
         Args:
             mock_proxmox: Mock ProxmoxAPI instance
             
@@ -363,6 +468,21 @@ class AssertionHelper:
     across tests (DRY principle).
     """
 
+    @staticmethod
+    def parse_response(response: list) -> Dict[str, Any]:
+        """Decode the JSON body of a single-content response.
+        
+        Identical bodies are decoded once and the same dict is returned,
+        so callers must treat the result as read-only.
+        
+        Args:
+            response: Response from VM operation
+            
+        Returns:
+            Decoded response data
+        """
+        return _decode_response_text(response[0].text)
+
     @staticmethod
     def assert_success_response(response: list, expected_message: str = None):
         """Assert that response indicates success.
@@ -371,11 +491,9 @@ class AssertionHelper:
             response: Response from VM operation
             expected_message: Expected success message (optional)
         """
-        import json
-        
         assert len(response) == 1, "Expected single response content"
         
-        response_data = json.loads(response[0].text)
+        response_data = AssertionHelper.parse_response(response)
         assert response_data["success"] is True, "Expected success=True"
         
         if expected_message:
@@ -395,17 +513,10 @@ class AssertionHelper:
         mock_proxmox.nodes.assert_called_with(node)
         mock_proxmox.nodes.return_value.qemu.assert_called_with(vmid)
         
-        # Verify operation-specific calls
-        operation_map = {
-            "start": mock_proxmox.nodes.return_value.qemu.return_value.status.start.post,
-            "stop": mock_proxmox.nodes.return_value.qemu.return_value.status.stop.post,
-            "shutdown": mock_proxmox.nodes.return_value.qemu.return_value.status.shutdown.post,
-            "restart": mock_proxmox.nodes.return_value.qemu.return_value.status.reboot.post,
-            "delete": mock_proxmox.nodes.return_value.qemu.return_value.delete,
-        }
-        
-        if operation in operation_map:
-            operation_map[operation].assert_called_once()
+        # Verify operation-specific calls, resolving only the endpoint under test
+        get_endpoint = _VM_OPERATION_ENDPOINTS.get(operation)
+        if get_endpoint is not None:
+            get_endpoint(mock_proxmox.nodes.return_value.qemu.return_value).assert_called_once()
 
     @staticmethod
     def assert_status_check_made(mock_proxmox: Mock):
@@ -0,0 +1,168 @@
+"""
+Lightweight ProxmoxAPI test double.
+
+Mirrors only the ProxmoxAPI endpoints used by the VM and container tools
+with plain objects instead of ``unittest.mock.Mock`` trees. Attribute
+access is an ordinary attribute lookup and calls are recorded in a plain
+list, which makes building and exercising the stub much cheaper than an
+equivalent Mock. Unknown endpoints raise AttributeError instead of
+silently returning a new Mock, so tests cannot drift from the real API
+paths (Liskov Substitution Principle).
+
+Endpoints keep the Mock attribute names used by the test suite
+(``return_value``, ``side_effect``, ``call_args``, ``assert_called_*``),
+so ProxmoxAPIMockBuilder and AssertionHelper work on either double.
+"""
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any, List, Optional
+from unittest.mock import call
+
+
+class StubEndpoint:
+    """Callable API endpoint that records its calls.
+
+    Implements the subset of the Mock interface used by the tests.
+    Child endpoints (e.g. ``qemu.post``) are plain attributes.
+    """
+
+    def __init__(self, return_value: Any = None, **children: Any):
+        """Initialize the endpoint.
+
+        Args:
+            return_value: Value returned when the endpoint is called
+            **children: Child endpoints or namespaces
+        """
+        self.__dict__.update(children)
+        self.return_value = return_value
+        self.side_effect = None
+        self.call_args_list: List[Any] = []
+
+    @property
+    def side_effect(self) -> Any:
+        """Exception, callable or iterable applied on each call."""
+        return self._side_effect
+
+    @side_effect.setter
+    def side_effect(self, value: Any) -> None:
+        # Match Mock: iterables are consumed one item per call
+        self._side_effect_source = value
+        if value is not None and not callable(value) and not isinstance(value, BaseException):
+            value = iter(value)
+        self._side_effect = value
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Record the call and apply ``side_effect``/``return_value``."""
+        self.call_args_list.append(call(*args, **kwargs))
+        effect = self._side_effect
+        if effect is None:
+            return self.return_value
+        if isinstance(effect, BaseException):
+            # Cached scenarios re-raise the same instance in every test;
+            # drop the previous traceback so frames do not pile up on it
+            raise effect.with_traceback(None)
+        if isinstance(effect, type) and issubclass(effect, BaseException):
+            raise effect
+        if isinstance(effect, Iterator):
+            result = next(effect)
+            if isinstance(result, BaseException):
+                raise result.with_traceback(None)
+            return result
+        return effect(*args, **kwargs)
+
+    @property
+    def call_count(self) -> int:
+        """Number of recorded calls."""
+        return len(self.call_args_list)
+
+    @property
+    def call_args(self) -> Optional[Any]:
+        """Arguments of the most recent call, or None if never called."""
+        return self.call_args_list[-1] if self.call_args_list else None
+
+    @property
+    def called(self) -> bool:
+        """Whether the endpoint has been called."""
+        return bool(self.call_args_list)
+
+    def reset_mock(self) -> None:
+        """Clear recorded calls, keeping configured return values.
+
+        Unlike Mock, an iterable ``side_effect`` is rewound to its first
+        item, so a cached scenario replays the same sequence in every test.
+        """
+        self.call_args_list.clear()
+        if isinstance(self._side_effect, Iterator):
+            self._side_effect = iter(self._side_effect_source)
+
+    def assert_called(self) -> None:
+        """Assert the endpoint was called at least once."""
+        if not self.call_args_list:
+            raise AssertionError("Expected endpoint to have been called.")
+
+    def assert_called_once(self) -> None:
+        """Assert the endpoint was called exactly once."""
+        if self.call_count != 1:
+            raise AssertionError(
+                f"Expected endpoint to have been called once. Called {self.call_count} times."
+            )
+
+    def assert_not_called(self) -> None:
+        """Assert the endpoint was never called."""
+        if self.call_args_list:
+            raise AssertionError(
+                f"Expected endpoint to not have been called. Called {self.call_count} times."
+            )
+
+    def assert_called_with(self, *args: Any, **kwargs: Any) -> None:
+        """Assert the most recent call used the given arguments."""
+        expected = call(*args, **kwargs)
+        if self.call_args != expected:
+            raise AssertionError(f"expected call not found.\nExpected: {expected}\nActual: {self.call_args}")
+
+    def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
+        """Assert the endpoint was called exactly once with the given arguments."""
+        self.assert_called_once()
+        self.assert_called_with(*args, **kwargs)
+
+
+class ProxmoxAPIStub:
+    """Plain-object stand-in for the ProxmoxAPI client.
+
+    Exposes the same call chains the tools use, for example
+    ``nodes(node).qemu(vmid).status.current.get()``. Every ``nodes(...)``
+    call returns the same node object, matching how the tests configure
+    a Mock through ``nodes.return_value``.
+    """
+
+    def __init__(self):
+        """Build the endpoint tree."""
+        self._endpoints: List[StubEndpoint] = []
+        vm = SimpleNamespace(
+            status=SimpleNamespace(
+                current=SimpleNamespace(get=self._endpoint()),
+                start=SimpleNamespace(post=self._endpoint()),
+                stop=SimpleNamespace(post=self._endpoint()),
+                shutdown=SimpleNamespace(post=self._endpoint()),
+                reboot=SimpleNamespace(post=self._endpoint()),
+            ),
+            config=SimpleNamespace(get=self._endpoint()),
+            delete=self._endpoint(),
+        )
+        container = SimpleNamespace(config=SimpleNamespace(get=self._endpoint()))
+        node = SimpleNamespace(
+            qemu=self._endpoint(vm, get=self._endpoint(), post=self._endpoint()),
+            lxc=self._endpoint(container, get=self._endpoint()),
+        )
+        self.nodes = self._endpoint(node, get=self._endpoint())
+
+    def _endpoint(self, return_value: Any = None, **children: Any) -> StubEndpoint:
+        """Create an endpoint and register it for reset_mock()."""
+        endpoint = StubEndpoint(return_value, **children)
+        self._endpoints.append(endpoint)
+        return endpoint
+
+    def reset_mock(self) -> None:
+        """Clear recorded calls on every endpoint."""
+        for endpoint in self._endpoints:
+            endpoint.reset_mock()
@@ -11,6 +11,9 @@ from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
 from proxmox_mcp.server import ProxmoxMCPServer
 
+# The console manager sleeps between exec and exec-status
+pytestmark = pytest.mark.usefixtures("no_sleep")
+
 @pytest.fixture
 def mock_env_vars():
     """Fixture to set up test environment variables."""
@@ -7,6 +7,9 @@ from unittest.mock import Mock, patch
 
 from proxmox_mcp.tools.console.manager import VMConsoleManager
 
+# The console manager sleeps between exec and exec-status
+pytestmark = pytest.mark.usefixtures("no_sleep")
+
 @pytest.fixture
 def mock_proxmox():
     """Fixture to create a mock ProxmoxAPI instance."""
@@ -10,9 +10,21 @@ Tests the delete_vm method following SOLID principles:
 """
 import pytest
 import json
-from unittest.mock import Mock
+from typing import Optional
 
-from tests.fixtures.base_test_classes import BaseVMLifecycleTest, BaseVMErrorTest
+from pydantic import BaseModel, ConfigDict
+
+from tests.fixtures.base_test_classes import BaseVMLifecycleTest, BaseVMErrorTest, DEFAULT_TEST_PARAMS
+
+
+class DeleteVMResponse(BaseModel):
+    """Expected delete_vm response structure (API standard)."""
+
+    model_config = ConfigDict(strict=True)
+
+    success: bool
+    message: str
+    upid: Optional[str]  # Required, but can be None
 
 
 class TestDeleteVMSuccess(BaseVMLifecycleTest):
@@ -21,13 +33,12 @@ class TestDeleteVMSuccess(BaseVMLifecycleTest):
     Follows SRP - only tests successful deletion operations.
     """
 
-    @pytest.mark.asyncio
     async def test_delete_vm_with_stopped_vm_returns_success(self):
         """Test deleting a stopped VM returns success response."""
         # Arrange
         mock_proxmox = self.setup_vm_for_delete_test()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         result = await vm_tools.delete_vm(
@@ -40,17 +51,13 @@ class TestDeleteVMSuccess(BaseVMLifecycleTest):
         self.assertion_helper.assert_api_call_made(mock_proxmox, "delete", params["node"], params["vmid"])
         self.assertion_helper.assert_status_check_made(mock_proxmox)
 
-    @pytest.mark.asyncio
     async def test_delete_vm_returns_task_id_in_response(self):
         """Test that delete VM returns task ID for monitoring."""
         # Arrange
         expected_task_id = "UPID:node1:00001234:56789ABC:timestamp:qmdestroy:100:user@pve:"
-        mock_proxmox = (self.mock_builder
-                       .with_vm_status("stopped")
-                       .with_delete_operation(expected_task_id)
-                       .build())
+        mock_proxmox = self.setup_vm_for_delete_test(task_id=expected_task_id)
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         result = await vm_tools.delete_vm(
@@ -59,10 +66,9 @@ class TestDeleteVMSuccess(BaseVMLifecycleTest):
         )
         
         # Assert
-        response_data = json.loads(result[0].text)
+        response_data = self.parse_response(result)
         assert response_data["upid"] == expected_task_id
 
-    @pytest.mark.asyncio
     async def test_delete_vm_with_different_node_succeeds(self):
         """Test deleting VM on different node succeeds."""
         # Arrange
@@ -80,7 +86,6 @@ class TestDeleteVMSuccess(BaseVMLifecycleTest):
         self.assert_delete_operation_success(result, "100")
         self.assertion_helper.assert_api_call_made(mock_proxmox, "delete", custom_node, "100")
 
-    @pytest.mark.asyncio
     async def test_delete_vm_with_different_vmid_succeeds(self):
         """Test deleting VM with different VMID succeeds."""
         # Arrange
@@ -98,13 +103,12 @@ class TestDeleteVMSuccess(BaseVMLifecycleTest):
         self.assert_delete_operation_success(result, custom_vmid)
         self.assertion_helper.assert_api_call_made(mock_proxmox, "delete", "node1", custom_vmid)
 
-    @pytest.mark.asyncio
     async def test_delete_vm_removes_all_vm_resources(self):
         """Test that delete VM removes all VM resources."""
         # Arrange
         mock_proxmox = self.setup_vm_for_delete_test()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         result = await vm_tools.delete_vm(
@@ -119,21 +123,18 @@ class TestDeleteVMSuccess(BaseVMLifecycleTest):
         mock_proxmox.nodes.return_value.qemu.return_value.delete.assert_called_once()
 
 
-class TestDeleteVMErrors(BaseVMErrorTest):
+class TestDeleteVMErrors(BaseVMLifecycleTest, BaseVMErrorTest):
     """Test VM deletion error scenarios.
     
     Follows SRP - only tests error conditions.
     """
 
-    @pytest.mark.asyncio
     async def test_delete_vm_with_running_vm_raises_value_error(self):
         """Test deleting running VM raises ValueError."""
         # Arrange
-        mock_proxmox = (self.mock_builder
-                       .with_vm_status("running")
-                       .build())
+        mock_proxmox = self.setup_vm_for_delete_test(status="running")
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act & Assert
         with self.assert_value_error_raised("must be stopped"):
@@ -146,13 +147,12 @@ class TestDeleteVMErrors(BaseVMErrorTest):
         self.assertion_helper.assert_status_check_made(mock_proxmox)
         mock_proxmox.nodes.return_value.qemu.return_value.delete.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_delete_vm_with_nonexistent_vm_raises_value_error(self):
         """Test deleting non-existent VM raises ValueError."""
         # Arrange
         mock_proxmox = self.setup_vm_not_found_error()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act & Assert
         with self.assert_value_error_raised("not found"):
@@ -161,176 +161,69 @@ class TestDeleteVMErrors(BaseVMErrorTest):
                 vmid=params["vmid"]
             )
 
-    # TODO: Advanced error scenario tests - currently archived due to mock configuration complexity
-    # These tests require enhanced mock builder support for specific Proxmox API error scenarios
-    # See: https://github.com/yourusername/proxmox-mcp/issues/XXX
-    
-    # @pytest.mark.asyncio
-    # async def test_delete_vm_with_locked_vm_raises_runtime_error(self):
-    #     """Test deleting locked VM raises RuntimeError."""
-    #     # Arrange
-    #     mock_proxmox = self.setup_operation_failure_error("delete", "VM is locked")
-    #     vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-    #     params = self.get_default_test_params()
-    #     
-    #     # Act & Assert
-    #     with self.assert_runtime_error_raised("VM is locked"):
-    #         await vm_tools.delete_vm(
-    #             node=params["node"],
-    #             vmid=params["vmid"]
-    #         )
-
-    # @pytest.mark.asyncio
-    # async def test_delete_vm_with_dependent_resources_raises_runtime_error(self):
-    #     """Test deleting VM with dependent resources raises RuntimeError."""
-    #     # Arrange
-    #     mock_proxmox = self.setup_operation_failure_error("delete", "VM has snapshots")
-    #     vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-    #     params = self.get_default_test_params()
-    #     
-    #     # Act & Assert
-    #     with self.assert_runtime_error_raised("VM has snapshots"):
-    #         await vm_tools.delete_vm(
-    #             node=params["node"],
-    #             vmid=params["vmid"]
-    #         )
-
-    # @pytest.mark.asyncio
-    # async def test_delete_vm_with_api_failure_raises_runtime_error(self):
-    #     """Test deleting VM with API failure raises RuntimeError."""
-    #     # Arrange
-    #     mock_proxmox = self.setup_operation_failure_error("delete", "Failed to destroy VM")
-    #     vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-    #     params = self.get_default_test_params()
-    #     
-    #     # Act & Assert
-    #     with self.assert_runtime_error_raised("Failed to destroy VM"):
-    #         await vm_tools.delete_vm(
-    #             node=params["node"],
-    #             vmid=params["vmid"]
-    #         )
-
-    # @pytest.mark.asyncio
-    # async def test_delete_vm_with_storage_error_raises_runtime_error(self):
-    #     """Test deleting VM with storage error raises RuntimeError."""
-    #     # Arrange
-    #     mock_proxmox = self.setup_operation_failure_error("delete", "Storage unavailable")
-    #     vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-    #     params = self.get_default_test_params()
-    #     
-    #     # Act & Assert
-    #     with self.assert_runtime_error_raised("Storage unavailable"):
-    #         await vm_tools.delete_vm(
-    #             node=params["node"],
-    #             vmid=params["vmid"]
-    #         )
+    @pytest.mark.parametrize("error_message", [
+        pytest.param("VM is locked", id="locked_vm"),
+        pytest.param("VM has snapshots", id="dependent_resources"),
+        pytest.param("Failed to destroy VM", id="api_failure"),
+        pytest.param("Storage unavailable", id="storage_error"),
+    ])
+    async def test_delete_vm_with_operation_failure_raises_runtime_error(self, error_message):
+        """Test VM deletion failing in the API raises RuntimeError."""
+        # Arrange
+        mock_proxmox = self.setup_vm_for_delete_failure_test(error_message)
+        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
+        params = DEFAULT_TEST_PARAMS
+        
+        # Act & Assert
+        with self.assert_runtime_error_raised(error_message):
+            await vm_tools.delete_vm(
+                node=params["node"],
+                vmid=params["vmid"]
+            )
 
 
 class TestDeleteVMResponseFormat(BaseVMLifecycleTest):
     """Test VM deletion response format validation.
     
-    Follows SRP - only tests response format compliance.
+    Follows SRP - only tests response format compliance. All format
+    properties are checked against a single delete_vm call.
     """
 
-    @pytest.mark.asyncio
-    async def test_delete_vm_response_contains_required_fields(self):
-        """Test that delete VM response contains all required fields."""
+    async def test_delete_vm_response_format(self):
+        """Test that delete VM response is valid JSON with the standard fields."""
         # Arrange
         mock_proxmox = self.setup_vm_for_delete_test()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        test_vmid = "789"
         
         # Act
         result = await vm_tools.delete_vm(
-            node=params["node"],
-            vmid=params["vmid"]
+            node="node1",
+            vmid=test_vmid
         )
         
         # Assert
         assert len(result) == 1
-        response_data = json.loads(result[0].text)
         
-        # Verify required response fields
+        # --- json ---
+        try:
+            response_data = self.parse_response(result)
+        except json.JSONDecodeError:
+            pytest.fail("Response is not valid JSON")
+        assert isinstance(response_data, dict)
+        
+        # --- required fields ---
         assert "success" in response_data
         assert "message" in response_data
         assert "upid" in response_data
-        
-        # Verify field values
         assert response_data["success"] is True
         assert "deleted successfully" in response_data["message"]
         assert response_data["upid"] is not None
-
-    @pytest.mark.asyncio
-    async def test_delete_vm_response_format_matches_api_standard(self):
-        """Test that delete VM response format matches API standard."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_delete_test()
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
-        
-        # Act
-        result = await vm_tools.delete_vm(
-            node=params["node"],
-            vmid=params["vmid"]
-        )
-        
-        # Assert
-        response_data = json.loads(result[0].text)
-        
-        # Verify response structure matches expected format
-        expected_structure = {
-            "success": bool,
-            "message": str,
-            "upid": (str, type(None))  # Can be string or None
-        }
-        
-        for field, expected_type in expected_structure.items():
-            assert field in response_data, f"Missing required field: {field}"
-            if isinstance(expected_type, tuple):
-                assert type(response_data[field]) in expected_type, f"Field {field} has wrong type"
-            else:
-                assert isinstance(response_data[field], expected_type), f"Field {field} has wrong type"
-
-    @pytest.mark.asyncio
-    async def test_delete_vm_response_is_valid_json(self):
-        """Test that delete VM response is valid JSON format."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_delete_test()
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
-        
-        # Act
-        result = await vm_tools.delete_vm(
-            node=params["node"],
-            vmid=params["vmid"]
-        )
         
-        # Assert
-        assert len(result) == 1
-        
-        # Should not raise exception when parsing JSON
-        try:
-            response_data = json.loads(result[0].text)
-            assert isinstance(response_data, dict)
-        except json.JSONDecodeError:
-            pytest.fail("Response is not valid JSON")
-
-    @pytest.mark.asyncio
-    async def test_delete_vm_response_message_includes_vmid(self):
-        """Test that delete VM response message includes the VM ID."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_delete_test()
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        test_vmid = "789"
+        # --- types (raises ValidationError on mismatch) ---
+        DeleteVMResponse.model_validate_json(result[0].text)
         
-        # Act
-        result = await vm_tools.delete_vm(
-            node="node1",
-            vmid=test_vmid
-        )
-        
-        # Assert
-        response_data = json.loads(result[0].text)
+        # --- vmid in message ---
         assert test_vmid in response_data["message"]
 
 
@@ -340,13 +233,12 @@ class TestDeleteVMStatusChecks(BaseVMLifecycleTest, BaseVMErrorTest):
     Follows SRP - only tests status checking logic.
     """
 
-    @pytest.mark.asyncio
     async def test_delete_vm_checks_current_status_before_operation(self):
         """Test that delete VM checks current status before attempting deletion."""
         # Arrange
         mock_proxmox = self.setup_vm_for_delete_test()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         await vm_tools.delete_vm(
@@ -354,21 +246,18 @@ class TestDeleteVMStatusChecks(BaseVMLifecycleTest, BaseVMErrorTest):
             vmid=params["vmid"]
         )
         
-        # Assert - Status check should be called before delete operation
+        # Assert - One status check and one delete call. Ordering is covered by
+        # test_delete_vm_with_running_vm_raises_value_error, where the
+        # status check rejects the VM and delete is never called.
         self.assertion_helper.assert_status_check_made(mock_proxmox)
-        
-        # Verify call order: status check before delete
-        handle = mock_proxmox.nodes.return_value.qemu.return_value
-        assert handle.status.current.get.call_count == 1
-        assert handle.delete.call_count == 1
+        self.assertion_helper.assert_api_call_made(mock_proxmox, "delete", params["node"], params["vmid"])
 
-    @pytest.mark.asyncio
     async def test_delete_vm_validates_stopped_status_requirement(self):
         """Test that delete VM validates VM must be in stopped state."""
         # Arrange - VM is in stopped state
         mock_proxmox = self.setup_vm_for_delete_test(status="stopped")
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         result = await vm_tools.delete_vm(
@@ -379,32 +268,13 @@ class TestDeleteVMStatusChecks(BaseVMLifecycleTest, BaseVMErrorTest):
         # Assert - Should succeed for stopped VM
         self.assert_delete_operation_success(result, params["vmid"])
 
-    @pytest.mark.asyncio
-    async def test_delete_vm_rejects_running_status(self):
-        """Test that delete VM rejects VMs in running state."""
-        # Arrange - VM is in running state
-        mock_proxmox = (self.mock_builder
-                       .with_vm_status("running")
-                       .build())
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
-        
-        # Act & Assert
-        with self.assert_value_error_raised("must be stopped"):
-            await vm_tools.delete_vm(
-                node=params["node"],
-                vmid=params["vmid"]
-            )
-
-    @pytest.mark.asyncio
-    async def test_delete_vm_rejects_paused_status(self):
-        """Test that delete VM rejects VMs in paused state."""
-        # Arrange - VM is in paused state
-        mock_proxmox = (self.mock_builder
-                       .with_vm_status("paused")
-                       .build())
+    @pytest.mark.parametrize("status", ["running", "paused"])
+    async def test_delete_vm_rejects_active_status(self, status):
+        """Test that delete VM rejects VMs in running or paused state."""
+        # Arrange - VM is in an active state
+        mock_proxmox = self.setup_vm_for_delete_test(status=status)
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act & Assert
         with self.assert_value_error_raised("must be stopped"):
@@ -420,13 +290,12 @@ class TestDeleteVMSafetyChecks(BaseVMLifecycleTest):
     Follows SRP - only tests safety checking logic.
     """
 
-    @pytest.mark.asyncio
     async def test_delete_vm_is_destructive_operation(self):
         """Test that delete VM performs destructive removal of VM."""
         # Arrange
         mock_proxmox = self.setup_vm_for_delete_test()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         result = await vm_tools.delete_vm(
@@ -438,16 +307,15 @@ class TestDeleteVMSafetyChecks(BaseVMLifecycleTest):
         mock_proxmox.nodes.return_value.qemu.return_value.delete.assert_called_once()
         
         # Verify success message indicates permanent deletion
-        response_data = json.loads(result[0].text)
+        response_data = self.parse_response(result)
         assert "deleted successfully" in response_data["message"]
 
-    @pytest.mark.asyncio
     async def test_delete_vm_handles_purge_operation(self):
         """Test that delete VM handles purge operation for complete removal."""
         # Arrange
         mock_proxmox = self.setup_vm_for_delete_test()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         result = await vm_tools.delete_vm(
@@ -468,7 +336,6 @@ class TestDeleteVMEdgeCases(BaseVMLifecycleTest):
     Follows SRP - only tests edge cases.
     """
 
-    @pytest.mark.asyncio
     async def test_delete_vm_with_special_characters_in_node_name_succeeds(self):
         """Test deleting VM with special characters in node name succeeds."""
         # Arrange
@@ -486,16 +353,12 @@ class TestDeleteVMEdgeCases(BaseVMLifecycleTest):
         self.assert_delete_operation_success(result, "100")
         self.assertion_helper.assert_api_call_made(mock_proxmox, "delete", special_node, "100")
 
-    @pytest.mark.asyncio
     async def test_delete_vm_handles_default_task_id_response(self):
         """Test deleting VM handles task ID response correctly."""
         # Arrange
-        mock_proxmox = (self.mock_builder
-                       .with_vm_status("stopped")
-                       .with_delete_operation()  # Default task ID
-                       .build())
+        mock_proxmox = self.setup_vm_for_delete_test()  # Default task ID
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         result = await vm_tools.delete_vm(
@@ -504,12 +367,11 @@ class TestDeleteVMEdgeCases(BaseVMLifecycleTest):
         )
         
         # Assert
-        response_data = json.loads(result[0].text)
+        response_data = self.parse_response(result)
         assert response_data["success"] is True
         assert response_data["upid"] is not None  # Should return valid UPID
         assert isinstance(response_data["upid"], str)  # Should be string type
 
-    @pytest.mark.asyncio
     async def test_delete_vm_with_high_vmid_number_succeeds(self):
         """Test deleting VM with high VMID number succeeds."""
         # Arrange
@@ -526,7 +388,6 @@ class TestDeleteVMEdgeCases(BaseVMLifecycleTest):
         # Assert
         self.assert_delete_operation_success(result, high_vmid)
 
-    @pytest.mark.asyncio
     async def test_delete_vm_with_minimal_vmid_succeeds(self):
         """Test deleting VM with minimal VMID succeeds."""
         # Arrange
@@ -10,9 +10,21 @@ Tests the start_vm method following SOLID principles:
 """
 import pytest
 import json
-from unittest.mock import Mock
+from typing import Optional
 
-from tests.fixtures.base_test_classes import BaseVMStartStopTest, BaseVMErrorTest
+from pydantic import BaseModel, ConfigDict
+
+from tests.fixtures.base_test_classes import BaseVMStartStopTest, BaseVMErrorTest, DEFAULT_TEST_PARAMS
+
+
+class StartVMResponse(BaseModel):
+    """Expected start_vm response structure (API standard)."""
+
+    model_config = ConfigDict(strict=True)
+
+    success: bool
+    message: str
+    upid: Optional[str]  # Required, but can be None
 
 
 class TestStartVMSuccess(BaseVMStartStopTest):
@@ -21,53 +33,39 @@ class TestStartVMSuccess(BaseVMStartStopTest):
     Follows SRP - only tests successful start operations.
     """
 
-    @pytest.mark.asyncio
-    async def test_start_vm_with_stopped_vm_returns_success(self):
-        """Test starting a stopped VM returns success response."""
+    @pytest.mark.parametrize("status,node,vmid", [
+        pytest.param("stopped", "node1", "100", id="stopped-default"),
+        pytest.param("paused", "node1", "100", id="paused"),
+        pytest.param("stopped", "node2", "100", id="different_node"),
+        pytest.param("stopped", "node1", "999", id="different_vmid"),
+        pytest.param("stopped", "very-long-node-name-for-testing-edge-cases", "100",
+                     id="long_node_name"),
+        pytest.param("stopped", "node1", "999999", id="numeric_string_vmid"),
+    ])
+    async def test_start_vm_succeeds(self, status, node, vmid):
+        """Test starting a stopped or paused VM returns success response."""
         # Arrange
-        mock_proxmox = self.setup_vm_for_start_test()
+        mock_proxmox = self.setup_vm_for_start_test(status=status)
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
         
         # Act
         result = await vm_tools.start_vm(
-            node=params["node"],
-            vmid=params["vmid"]
+            node=node,
+            vmid=vmid
         )
         
         # Assert
-        self.assert_start_operation_success(result, params["vmid"])
-        self.assertion_helper.assert_api_call_made(mock_proxmox, "start", params["node"], params["vmid"])
+        self.assert_start_operation_success(result, vmid)
+        self.assertion_helper.assert_api_call_made(mock_proxmox, "start", node, vmid)
         self.assertion_helper.assert_status_check_made(mock_proxmox)
 
-    @pytest.mark.asyncio
-    async def test_start_vm_with_paused_vm_returns_success(self):
-        """Test starting a paused VM returns success response."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_start_test(status="paused")
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
-        
-        # Act
-        result = await vm_tools.start_vm(
-            node=params["node"],
-            vmid=params["vmid"]
-        )
-        
-        # Assert
-        self.assert_start_operation_success(result, params["vmid"])
-
-    @pytest.mark.asyncio
     async def test_start_vm_returns_task_id_in_response(self):
         """Test that start VM returns task ID for monitoring."""
         # Arrange
         expected_task_id = "UPID:node1:00001234:56789ABC:timestamp:qmstart:100:user@pve:"
-        mock_proxmox = (self.mock_builder
-                       .with_vm_status("stopped")
-                       .with_start_operation(expected_task_id)
-                       .build())
+        mock_proxmox = self.setup_vm_for_start_test(task_id=expected_task_id)
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         result = await vm_tools.start_vm(
@@ -76,45 +74,9 @@ class TestStartVMSuccess(BaseVMStartStopTest):
         )
         
         # Assert
-        response_data = json.loads(result[0].text)
+        response_data = self.parse_response(result)
         assert response_data["upid"] == expected_task_id
 
-    @pytest.mark.asyncio
-    async def test_start_vm_with_different_node_succeeds(self):
-        """Test starting VM on different node succeeds."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_start_test()
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        custom_node = "node2"
-        
-        # Act
-        result = await vm_tools.start_vm(
-            node=custom_node,
-            vmid="100"
-        )
-        
-        # Assert
-        self.assert_start_operation_success(result, "100")
-        self.assertion_helper.assert_api_call_made(mock_proxmox, "start", custom_node, "100")
-
-    @pytest.mark.asyncio
-    async def test_start_vm_with_different_vmid_succeeds(self):
-        """Test starting VM with different VMID succeeds."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_start_test()
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        custom_vmid = "999"
-        
-        # Act
-        result = await vm_tools.start_vm(
-            node="node1",
-            vmid=custom_vmid
-        )
-        
-        # Assert
-        self.assert_start_operation_success(result, custom_vmid)
-        self.assertion_helper.assert_api_call_made(mock_proxmox, "start", "node1", custom_vmid)
-
 
 class TestStartVMErrors(BaseVMErrorTest):
     """Test VM start error scenarios.
@@ -122,13 +84,12 @@ class TestStartVMErrors(BaseVMErrorTest):
     Follows SRP - only tests error conditions.
     """
 
-    @pytest.mark.asyncio
     async def test_start_vm_with_already_running_vm_raises_value_error(self):
         """Test starting already running VM raises ValueError."""
         # Arrange
         mock_proxmox = self.setup_vm_already_running_error()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act & Assert
         with self.assert_value_error_raised("already running"):
@@ -141,13 +102,12 @@ class TestStartVMErrors(BaseVMErrorTest):
         self.assertion_helper.assert_status_check_made(mock_proxmox)
         mock_proxmox.nodes.return_value.qemu.return_value.status.start.post.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_start_vm_with_nonexistent_vm_raises_value_error(self):
         """Test starting non-existent VM raises ValueError."""
         # Arrange
         mock_proxmox = self.setup_vm_not_found_error()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act & Assert
         with self.assert_value_error_raised("not found"):
@@ -156,161 +116,72 @@ class TestStartVMErrors(BaseVMErrorTest):
                 vmid=params["vmid"]
             )
 
-    # TODO: Advanced error scenario tests - currently archived due to mock configuration complexity
-    # These tests require enhanced mock builder support for specific Proxmox API error scenarios
-    # See: https://github.com/yourusername/proxmox-mcp/issues/XXX
-    
-    # @pytest.mark.asyncio
-    # async def test_start_vm_with_insufficient_resources_raises_runtime_error(self):
-    #     """Test starting VM with insufficient resources raises RuntimeError."""
-    #     # Arrange
-    #     mock_proxmox = self.setup_operation_failure_error("start", "Insufficient memory to start VM")
-    #     vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-    #     params = self.get_default_test_params()
-    #     
-    #     # Act & Assert
-    #     with self.assert_runtime_error_raised("Insufficient memory"):
-    #         await vm_tools.start_vm(
-    #             node=params["node"],
-    #             vmid=params["vmid"]
-    #         )
-
-    # @pytest.mark.asyncio
-    # async def test_start_vm_with_storage_unavailable_raises_runtime_error(self):
-    #     """Test starting VM with unavailable storage raises RuntimeError."""
-    #     # Arrange
-    #     mock_proxmox = self.setup_operation_failure_error("start", "Storage 'local-zfs' is not available")
-    #     vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-    #     params = self.get_default_test_params()
-    #     
-    #     # Act & Assert
-    #     with self.assert_runtime_error_raised("Storage.*not available"):
-    #         await vm_tools.start_vm(
-    #             node=params["node"],
-    #             vmid=params["vmid"]
-    #         )
-
-    # @pytest.mark.asyncio
-    # async def test_start_vm_with_locked_vm_raises_runtime_error(self):
-    #     """Test starting locked VM raises RuntimeError."""
-    #     # Arrange
-    #     mock_proxmox = self.setup_operation_failure_error("start", "VM is locked")
-    #     vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-    #     params = self.get_default_test_params()
-    #     
-    #     # Act & Assert
-    #     with self.assert_runtime_error_raised("VM is locked"):
-    #         await vm_tools.start_vm(
-    #             node=params["node"],
-    #             vmid=params["vmid"]
-    #         )
+    @pytest.mark.parametrize("error_message,expected_pattern", [
+        pytest.param("Insufficient memory to start VM", "Insufficient memory",
+                     id="insufficient_resources"),
+        pytest.param("Storage 'local-zfs' is not available", "Storage.*not available",
+                     id="storage_unavailable"),
+        pytest.param("VM is locked", "VM is locked", id="locked_vm"),
+    ])
+    async def test_start_vm_with_operation_failure_raises_runtime_error(
+        self, error_message, expected_pattern
+    ):
+        """Test VM start failing in the API raises RuntimeError."""
+        # Arrange
+        mock_proxmox = self.setup_operation_failure_error("start", error_message)
+        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
+        params = DEFAULT_TEST_PARAMS
+        
+        # Act & Assert
+        with self.assert_runtime_error_raised(expected_pattern):
+            await vm_tools.start_vm(
+                node=params["node"],
+                vmid=params["vmid"]
+            )
 
 
 class TestStartVMResponseFormat(BaseVMStartStopTest):
     """Test VM start response format validation.
     
-    Follows SRP - only tests response format compliance.
+    Follows SRP - only tests response format compliance. All format
+    properties are checked against a single start_vm call.
     """
 
-    @pytest.mark.asyncio
-    async def test_start_vm_response_contains_required_fields(self):
-        """Test that start VM response contains all required fields."""
+    async def test_start_vm_response_format(self):
+        """Test that start VM response is valid JSON with the standard fields."""
         # Arrange
         mock_proxmox = self.setup_vm_for_start_test()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        test_vmid = "123"
         
         # Act
         result = await vm_tools.start_vm(
-            node=params["node"],
-            vmid=params["vmid"]
+            node="node1",
+            vmid=test_vmid
         )
         
         # Assert
         assert len(result) == 1
-        response_data = json.loads(result[0].text)
         
-        # Verify required response fields
+        # --- json ---
+        try:
+            response_data = self.parse_response(result)
+        except json.JSONDecodeError:
+            pytest.fail("Response is not valid JSON")
+        assert isinstance(response_data, dict)
+        
+        # --- required fields ---
         assert "success" in response_data
         assert "message" in response_data
         assert "upid" in response_data
-        
-        # Verify field values
         assert response_data["success"] is True
         assert "started successfully" in response_data["message"]
         assert response_data["upid"] is not None
-
-    @pytest.mark.asyncio
-    async def test_start_vm_response_format_matches_api_standard(self):
-        """Test that start VM response format matches API standard."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_start_test()
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
-        
-        # Act
-        result = await vm_tools.start_vm(
-            node=params["node"],
-            vmid=params["vmid"]
-        )
-        
-        # Assert
-        response_data = json.loads(result[0].text)
-        
-        # Verify response structure matches expected format
-        expected_structure = {
-            "success": bool,
-            "message": str,
-            "upid": (str, type(None))  # Can be string or None
-        }
-        
-        for field, expected_type in expected_structure.items():
-            assert field in response_data, f"Missing required field: {field}"
-            if isinstance(expected_type, tuple):
-                assert type(response_data[field]) in expected_type, f"Field {field} has wrong type"
-            else:
-                assert isinstance(response_data[field], expected_type), f"Field {field} has wrong type"
-
-    @pytest.mark.asyncio
-    async def test_start_vm_response_is_valid_json(self):
-        """Test that start VM response is valid JSON format."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_start_test()
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
-        
-        # Act
-        result = await vm_tools.start_vm(
-            node=params["node"],
-            vmid=params["vmid"]
-        )
         
-        # Assert
-        assert len(result) == 1
-        
-        # Should not raise exception when parsing JSON
-        try:
-            response_data = json.loads(result[0].text)
-            assert isinstance(response_data, dict)
-        except json.JSONDecodeError:
-            pytest.fail("Response is not valid JSON")
-
-    @pytest.mark.asyncio
-    async def test_start_vm_response_message_includes_vmid(self):
-        """Test that start VM response message includes the VM ID."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_start_test()
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        test_vmid = "123"
-        
-        # Act
-        result = await vm_tools.start_vm(
-            node="node1",
-            vmid=test_vmid
-        )
+        # --- types (raises ValidationError on mismatch) ---
+        StartVMResponse.model_validate_json(result[0].text)
         
-        # Assert
-        response_data = json.loads(result[0].text)
+        # --- vmid in message ---
         assert test_vmid in response_data["message"]
 
 
@@ -320,13 +191,12 @@ class TestStartVMStatusChecks(BaseVMStartStopTest, BaseVMErrorTest):
     Follows SRP - only tests status checking logic.
     """
 
-    @pytest.mark.asyncio
     async def test_start_vm_checks_current_status_before_operation(self):
         """Test that start VM checks current status before attempting start."""
         # Arrange
         mock_proxmox = self.setup_vm_for_start_test()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         await vm_tools.start_vm(
@@ -334,38 +204,18 @@ class TestStartVMStatusChecks(BaseVMStartStopTest, BaseVMErrorTest):
             vmid=params["vmid"]
         )
         
-        # Assert - Status check should be called before start operation
+        # Assert - One status check and one start call. Ordering is covered by
+        # test_start_vm_with_already_running_vm_raises_value_error, where the
+        # status check rejects the VM and start is never called.
         self.assertion_helper.assert_status_check_made(mock_proxmox)
-        
-        # Verify call order: status check before start
-        handle = mock_proxmox.nodes.return_value.qemu.return_value
-        assert handle.status.current.get.call_count == 1
-        assert handle.status.start.post.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_start_vm_validates_stopped_status_requirement(self):
-        """Test that start VM validates VM must be in stopped state."""
-        # Arrange - VM is in stopped state
-        mock_proxmox = self.setup_vm_for_start_test(status="stopped")
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
-        
-        # Act
-        result = await vm_tools.start_vm(
-            node=params["node"],
-            vmid=params["vmid"]
-        )
-        
-        # Assert - Should succeed for stopped VM
-        self.assert_start_operation_success(result, params["vmid"])
+        self.assertion_helper.assert_api_call_made(mock_proxmox, "start", params["node"], params["vmid"])
 
-    @pytest.mark.asyncio
     async def test_start_vm_rejects_running_status(self):
         """Test that start VM rejects VMs in running state."""
         # Arrange - VM is in running state
         mock_proxmox = self.setup_vm_already_running_error()
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act & Assert
         with self.assert_value_error_raised("already running"):
@@ -381,51 +231,12 @@ class TestStartVMEdgeCases(BaseVMStartStopTest):
     Follows SRP - only tests edge cases.
     """
 
-    @pytest.mark.asyncio
-    async def test_start_vm_with_long_node_name_succeeds(self):
-        """Test starting VM with long node name succeeds."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_start_test()
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        long_node_name = "very-long-node-name-for-testing-edge-cases"
-        
-        # Act
-        result = await vm_tools.start_vm(
-            node=long_node_name,
-            vmid="100"
-        )
-        
-        # Assert
-        self.assert_start_operation_success(result, "100")
-        self.assertion_helper.assert_api_call_made(mock_proxmox, "start", long_node_name, "100")
-
-    @pytest.mark.asyncio
-    async def test_start_vm_with_numeric_string_vmid_succeeds(self):
-        """Test starting VM with numeric string VMID succeeds."""
-        # Arrange
-        mock_proxmox = self.setup_vm_for_start_test()
-        vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        numeric_vmid = "999999"
-        
-        # Act
-        result = await vm_tools.start_vm(
-            node="node1",
-            vmid=numeric_vmid
-        )
-        
-        # Assert
-        self.assert_start_operation_success(result, numeric_vmid)
-
-    @pytest.mark.asyncio
     async def test_start_vm_handles_default_task_id_response(self):
         """Test starting VM handles task ID response correctly."""
         # Arrange
-        mock_proxmox = (self.mock_builder
-                       .with_vm_status("stopped")
-                       .with_start_operation()  # Default task ID
-                       .build())
+        mock_proxmox = self.setup_vm_for_start_test()  # Default task ID
         vm_tools = self.create_vm_tools_with_mock(mock_proxmox)
-        params = self.get_default_test_params()
+        params = DEFAULT_TEST_PARAMS
         
         # Act
         result = await vm_tools.start_vm(
@@ -434,7 +245,7 @@ class TestStartVMEdgeCases(BaseVMStartStopTest):
         )
         
         # Assert
-        response_data = json.loads(result[0].text)
+        response_data = self.parse_response(result)
         assert response_data["success"] is True
         assert response_data["upid"] is not None  # Should return valid UPID
         assert isinstance(response_data["upid"], str)  # Should be string type
\ No newline at end of file